@@ -20,5 +20,6 @@ mkdir -p unversioned
 
 echo "-- starting docker python instance --"
 
-docker run -v $(pwd):/app --rm --entrypoint /bin/sh -e API_KEY="$1" -e API_ENDPOINT="$2" python:3-alpine -c \
-  "pip install requests && python3 /app/scripts/fetch_currency_conversion_rates.py $3 $4 $5 $6 ${7:-}"
\ No newline at end of file
+docker run -v $(pwd):/app --rm --entrypoint /bin/sh -e API_KEY="$1" -e API_ENDPOINT="$2" \
+  -e CACHE_DIR=/app/unversioned/cache python:3-alpine -c \
+  "pip install requests brotli orjson && python3 /app/scripts/fetch_currency_conversion_rates.py $3 $4 $5 $6 ${7:-}"
\ No newline at end of file
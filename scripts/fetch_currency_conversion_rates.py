@@ -5,10 +5,12 @@ A script to fetch data from fetch_currency_conversion_rates.py and
 store it in json file if provided.
 
 You have set environment variable API_KEY, API_ENDPOINT before executing code.
+Set CACHE_DIR as well to cache fetched date windows on disk.
 
 Usage:
     python fetch_currency_conversion_rates.py
       <base> <symbols> <start_date> <end_date> <api_key> <api_endpoint> [<output_file>]
+    python fetch_currency_conversion_rates.py --manifest <manifest_file> [--concurrency <n>]
 
 Arguments:
     base (str): Source Currency Code.
@@ -18,19 +20,41 @@ Arguments:
     api_key(str): Authorized Api key.
     api_endpoint(str): Currency Exchange provider api.
     output_file (str): The path to the output JSON file.
+    manifest_file (str): JSON file listing several jobs with the arguments above.
 """
 import os
+import re
 import sys
 import json
-from datetime import datetime
+import time
+import functools
+import hashlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 import argparse
 # pylint: disable=E0401
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InvalidHeader, MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+
+# orjson is optional; fall back to the standard library when it is missing.
+try:
+    # pylint: disable=E0401
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class APILimitExceededError(Exception):
     """Exception raised when the API limit is exceeded."""
 
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        # Value of the Retry-After header of the last response, if any.
+        self.retry_after = retry_after
+
 class UnauthorizedError(Exception):
     """Exception raised for unauthorized access due to incorrect API key."""
 
@@ -46,45 +70,218 @@ class ServiceUnavailableError(Exception):
 class UnexpectedError(Exception):
     """Exception raised for unexpected errors."""
 
-def save_data_to_json(data, output_file):
+def ensure_dir(path):
+    """
+    Creates the parent directory of a file path if it does not exist yet.
+
+    exist_ok avoids a separate existence check, which also makes it safe for
+    parallel jobs writing into the same new directory.
+
+    Parameters:
+    - path (str): The path of the file about to be written.
+    """
+    output_dir = os.path.dirname(path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+def save_data_to_json(data, output_file, out=None):
     """
     Saves the provided data to a specified JSON file.
 
     Parameters:
     - data (list): The data to be saved, typically a list of dictionaries.
     - output_file (str): The path to the output JSON file.
+    - out (file): Stream for progress messages, defaults to sys.stdout.
 
     Raises:
     - IOError: If there is an issue writing to the file.
     """
-    output_dir = os.path.dirname(output_file)
-    if output_dir and not os.path.exists(output_dir):
-        print(f"Directory does not exist. Creating: {output_dir}")
-        os.makedirs(output_dir)
+    ensure_dir(output_file)
 
     # Save the data to the specified JSON file with UTF-8 encoding
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4)
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            # pylint: disable=E1101
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        # json.dump issues one small write per token; encode first and write once
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data, indent=2))
+
+    print(f"Data saved to {output_file}", file=out)
+
+# Number of days requested per API call when splitting a long date range.
+DEFAULT_CHUNK_DAYS = 30
+
+# Number of date windows fetched in parallel.
+DEFAULT_CONCURRENCY = 4
+
+# Number of manifest jobs fetched in parallel unless --concurrency is given.
+# Each job fetches up to DEFAULT_CONCURRENCY windows at once, and the
+# connection pool below is sized for both limits together.
+DEFAULT_JOB_CONCURRENCY = 4
+
+# Number of hosts the connection pool keeps connections to.
+POOL_CONNECTIONS = 8
+
+# Connect and read timeouts, in seconds, for each API call.
+REQUEST_TIMEOUT = (5, 30)
+
+# Longest Retry-After, in seconds, worth waiting for before retrying. A longer
+# wait usually means the quota is used up, so the 429 is surfaced instead.
+MAX_RETRY_AFTER = 60
+
+class _BoundedRetry(Retry):
+    """Retry that gives up instead of sleeping through a long Retry-After."""
+
+    def increment(self, method=None, url=None, response=None, error=None,  # pylint: disable=R0913,R0917
+                  _pool=None, _stacktrace=None):
+        if response is not None and self.respect_retry_after_header:
+            try:
+                retry_after = self.get_retry_after(response)
+            except InvalidHeader:
+                retry_after = None
+            if retry_after is not None and retry_after > MAX_RETRY_AFTER:
+                # With raise_on_status=False urllib3 hands this response back
+                raise MaxRetryError(
+                  _pool, url, ResponseError(f"Retry-After {retry_after:.0f}s is too long")
+                )
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+# Shared session so that repeated and concurrent calls reuse kept-alive
+# connections instead of paying a TCP and TLS handshake each time.
+# Rate limited and transient errors are retried with exponential backoff,
+# honouring Retry-After up to MAX_RETRY_AFTER. raise_on_status=False hands the last response back
+# once retries are exhausted, so fetch_window can map its status code to an
+# exception.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=POOL_CONNECTIONS,
+    pool_maxsize=DEFAULT_JOB_CONCURRENCY * DEFAULT_CONCURRENCY,
+    max_retries=_BoundedRetry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+# requests already advertises gzip and deflate, and adds br when brotli is
+# installed; setting Accept-Encoding by hand could advertise an encoding
+# urllib3 is unable to decode.
+_SESSION.headers['Accept'] = 'application/json'
+
+# Function to size the connection pool for the number of parallel jobs
+def size_connection_pool(job_concurrency):
+    """
+    Resizes the shared connection pool so every window fetched in parallel by
+    job_concurrency jobs can keep its connection alive.
+
+    The pool does not block when it is full; extra connections are simply
+    closed after use, so this only affects connection reuse. Call it before
+    any request is made, as the connections already open are dropped.
+
+    Parameters:
+    - job_concurrency (int): Number of jobs fetched in parallel.
+    """
+    _ADAPTER.poolmanager.clear()
+    _ADAPTER.init_poolmanager(POOL_CONNECTIONS, job_concurrency * DEFAULT_CONCURRENCY)
+
+# Seconds a cached window stays valid when it was written on or before its
+# end date. Windows cached after they ended never change, so they are
+# cached forever.
+CACHE_TTL = 900
+
+# Function to split a date range into smaller windows
+def split_date_range(start_date, end_date, chunk_days=DEFAULT_CHUNK_DAYS):
+    """
+    Splits a date range into consecutive windows of at most chunk_days days.
+
+    Parameters:
+    - start_date (str): The start date in YYYY-MM-DD format.
+    - end_date (str): The end date in YYYY-MM-DD format.
+    - chunk_days (int): Maximum number of days per window.
 
-    print(f"Data saved to {output_file}")
+    Returns:
+    - list: (start_date, end_date) tuples covering the whole range, in order.
+
+    Raises:
+    - ValueError: If chunk_days is lower than 1.
+    """
+    if chunk_days < 1:
+        raise ValueError(f"chunk_days must be at least 1, got {chunk_days}.")
+
+    start = datetime.strptime(start_date, '%Y-%m-%d').date()
+    end = datetime.strptime(end_date, '%Y-%m-%d').date()
+
+    windows = []
+    while True:
+        window_end = min(start + timedelta(days=chunk_days - 1), end)
+        windows.append((start.isoformat(), window_end.isoformat()))
+        if window_end >= end:
+            return windows
+        start = window_end + timedelta(days=1)
 
 # Function to make the API request
-def fetch_timeseries(base, symbols, start_date, end_date):
+def fetch_timeseries(base, symbols, start_date, end_date,  # pylint: disable=R0913,R0917
+                     chunk_days=DEFAULT_CHUNK_DAYS, concurrency=DEFAULT_CONCURRENCY):
     """
     Fetches the historical currency exchange rates from the CurrencyBeacon API.
 
+    Long date ranges are split into windows of chunk_days days which are
+    fetched in parallel, at most concurrency at a time.
+
     Parameters:
     - base (str): The base currency code (e.g., "USD").
     - symbols (list): A list of target currency codes (e.g., ["EUR", "GBP"]).
     - start_date (str): The start date for the timeseries in YYYY-MM-DD format.
     - end_date (str): The end date for the timeseries in YYYY-MM-DD format.
+    - chunk_days (int): Maximum number of days requested per API call.
+    - concurrency (int): Maximum number of API calls in flight.
 
     Returns:
-    - dict: The JSON response from the API containing the exchange rates.
+    - list: The formatted exchange rates, ordered by date.
 
     Raises:
+    - ValueError: If chunk_days or concurrency is lower than 1.
     - Exception: If there is an error in the API request, an exception is raised.
     """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}.")
+
+    windows = split_date_range(start_date, end_date, chunk_days)
+    if len(windows) == 1:
+        return fetch_window(base, symbols, start_date, end_date)
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(windows))) as executor:
+        parts = executor.map(lambda window: fetch_window(base, symbols, *window), windows)
+        return [row for part in parts for row in part]
+
+# Function to fetch a single date window
+def fetch_window(base, symbols, start_date, end_date):
+    """
+    Fetches the exchange rates for a single date window with one API call.
+
+    Parameters:
+    - base (str): The base currency code (e.g., "USD").
+    - symbols (list): A list of target currency codes (e.g., ["EUR", "GBP"]).
+    - start_date (str): The start date for the window in YYYY-MM-DD format.
+    - end_date (str): The end date for the window in YYYY-MM-DD format.
+
+    Returns:
+    - list: The formatted exchange rates for the window.
+
+    Raises:
+    - Exception: If there is an error in the API request, an exception is raised.
+    """
+    cache_file = get_cache_file(base, symbols, start_date, end_date)
+    cached_data = load_cached_data(cache_file, end_date)
+    if cached_data is not None:
+        return cached_data
+
     api_key = os.getenv("API_KEY")
     endpoint = os.getenv("API_ENDPOINT")
 
@@ -99,11 +296,14 @@ def fetch_timeseries(base, symbols, start_date, end_date):
     }
 
     # Make the API request
-    response = requests.get(url, params=params)
+    response = _SESSION.get(url, params=params, timeout=REQUEST_TIMEOUT)
 
     # Handle response
     if response.status_code == 200:
-        return format_data(base, response)
+        data = format_data(base, response.json())
+        if cache_file:
+            save_cached_data(data, cache_file)
+        return data
 
     if response.status_code == 401:
         raise UnauthorizedError("Unauthorized - API key missing or incorrect.")
@@ -114,36 +314,114 @@ def fetch_timeseries(base, symbols, start_date, end_date):
     if response.status_code == 503:
         raise ServiceUnavailableError("Service Unavailable - Try again later.")
     if response.status_code == 429:
-        raise APILimitExceededError("Too many requests - API limits reached.")
+        retry_after = response.headers.get('Retry-After')
+        message = "Too many requests - API limits reached."
+        if retry_after:
+            message += f" Retry after: {retry_after}."
+        raise APILimitExceededError(message, retry_after)
 
     raise UnexpectedError(f"Unexpected error: {response.status_code} - {response.text}")
 
+# Function to locate the cache file of a date window
+def get_cache_file(base, symbols, start_date, end_date):
+    """
+    Returns the cache file path for a date window.
+
+    You have to set environment variable CACHE_DIR to enable caching.
+
+    Parameters:
+    - base (str): The base currency code (e.g., "USD").
+    - symbols (list): A list of target currency codes (e.g., ["EUR", "GBP"]).
+    - start_date (str): The start date for the window in YYYY-MM-DD format.
+    - end_date (str): The end date for the window in YYYY-MM-DD format.
+
+    Returns:
+    - str: The cache file path, or None if caching is disabled.
+    """
+    cache_dir = os.getenv("CACHE_DIR")
+    if not cache_dir:
+        return None
+
+    key = f"{base}|{','.join(sorted(symbols))}|{start_date}|{end_date}"
+    return os.path.join(cache_dir, hashlib.sha1(key.encode()).hexdigest() + '.json')
+
+# Function to read a cached date window
+def load_cached_data(cache_file, end_date):
+    """
+    Loads the formatted data of a date window from the cache.
+
+    Parameters:
+    - cache_file (str): The cache file path, or None if caching is disabled.
+    - end_date (str): The end date for the window in YYYY-MM-DD format.
+
+    Returns:
+    - list: The cached formatted data, or None on a cache miss or expired entry.
+    """
+    if not cache_file or not os.path.exists(cache_file):
+        return None
+
+    # Only an entry written after its window ended holds the final rates; one
+    # written earlier may be a partial snapshot and expires like any other.
+    written_at = os.path.getmtime(cache_file)
+    if datetime.fromtimestamp(written_at).strftime('%Y-%m-%d') <= end_date and \
+            time.time() - written_at > CACHE_TTL:
+        return None
+
+    with open(cache_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+# Function to write a date window to the cache
+def save_cached_data(data, cache_file):
+    """
+    Saves the formatted data of a date window to the cache.
+
+    The data is written to a temporary file first and moved into place, so
+    concurrent readers never see a partially written entry.
+
+    Parameters:
+    - data (list): The formatted data of the window.
+    - cache_file (str): The cache file path.
+    """
+    ensure_dir(cache_file)
+    fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp_file, cache_file)
+
 # Function format the response
-def format_data(base, response):
+def format_data(base, payload):
     """
     Function format the response return from api.
 
     Parameters:
     - base (str): Base currency code.
-    - response (object): Response return from api.
+    - payload (dict): JSON body returned from api, parsed once by the caller.
 
     Returns:
     - list: formatted response.
     """
 
     formatted_data = []
-    for date, rates in response.json()['response'].items():
+    # Bind the hot lookups to locals once instead of per rate
+    append = formatted_data.append
+    _round = round
+    for date, rates in payload['response'].items():
         for symbol, rate in rates.items():
-            formatted_data.append({
+            append({
                 'date': date,
                 'source': base,
                 'dest': symbol,
-                'rate': round(rate, 4)  # rounding to 4 decimal places for consistency
+                'rate': _round(rate, 4)  # rounding to 4 decimal places for consistency
             })
     # print(formatted_data)
     return formatted_data
 
+# Date in YYYY-MM-DD format, as sent to the API.
+_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})', re.ASCII)
+
 # Function to validate date format (YYYY-MM-DD)
+# Results are memoized since manifests repeat the same dates across jobs.
+@functools.lru_cache(maxsize=256)
 def validate_date(date_str):
     """
     Validates if the date string is in the format YYYY-MM-DD.
@@ -154,13 +432,22 @@ def validate_date(date_str):
     Returns:
     - bool: True if the date string is in valid format, otherwise False.
     """
+    match = _DATE_RE.fullmatch(date_str)
+    if not match:
+        return False
+
+    # The pattern only checks the shape; let datetime reject e.g. 2024-09-31
     try:
-        datetime.strptime(date_str, '%Y-%m-%d')
+        datetime(*map(int, match.groups()))
         return True
     except ValueError:
         return False
 
+# Comma-separated list of 3-letter currency codes.
+_SYMBOLS_RE = re.compile(r'[A-Za-z]{3}(?:,[A-Za-z]{3})*')
+
 # Function to validate currency symbols
+@functools.lru_cache(maxsize=256)
 def validate_symbols(symbols):
     """
     Validates if the currency symbols are provided as a comma-separated list.
@@ -171,67 +458,251 @@ def validate_symbols(symbols):
     Returns:
     - bool: True if the symbols are valid, otherwise False.
     """
-    if symbols:
-        valid_symbols = symbols.split(',')
-        if all(symbol.isalpha() and len(symbol) == 3 for symbol in valid_symbols):
-            return True
-    return False
+    return bool(symbols) and _SYMBOLS_RE.fullmatch(symbols) is not None
 
-# Main function
-def main():
+# Function to load a manifest of jobs
+def load_manifest(manifest_file):
     """
-    The main function that parses command-line arguments, validates them, and fetches
-    the currency exchange rates from the CurrencyBeacon API.
+    Loads a list of jobs from a JSON manifest file.
+
+    Each job is an object with the keys base, symbols, start_date, end_date
+    and optionally output_file, taking the same values as the command-line
+    arguments, e.g. {"base": "USD", "symbols": "EUR,GBP", ...}.
+
+    Parameters:
+    - manifest_file (str): The path to the manifest JSON file.
+
+    Returns:
+    - list: The jobs as dictionaries.
+
+    Raises:
+    - OSError: If the manifest file cannot be read.
+    - ValueError: If the manifest is not valid JSON or not a non-empty list of
+      job objects with string values.
+    """
+    with open(manifest_file, 'r', encoding='utf-8') as f:
+        jobs = json.load(f)
+
+    if not isinstance(jobs, list) or not jobs:
+        raise ValueError("the manifest must be a non-empty list of jobs")
+    for job in jobs:
+        if not isinstance(job, dict) or \
+                not all(isinstance(value, str) for value in job.values()):
+            raise ValueError(f"each job must be an object with string values, got {job!r}")
+    return jobs
+
+# Function to parse a positive --concurrency value
+def positive_int(value):
+    """
+    Parses a command-line value as an integer of at least 1.
+
+    Parameters:
+    - value (str): The command-line value.
+
+    Returns:
+    - int: The parsed value.
+
+    Raises:
+    - argparse.ArgumentTypeError: If the value is not in range.
+    """
+    try:
+        number = int(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from e
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+# Function to validate a job
+def validate_job(job, out=None):
+    """
+    Validates the arguments of a job, exiting with an error message if invalid.
+
+    Parameters:
+    - job (dict): The job with base, symbols, start_date, end_date and output_file keys.
+    - out (file): Stream the errors are printed to, defaults to sys.stdout.
+    """
+    missing = [key for key in ('base', 'symbols', 'start_date', 'end_date') if key not in job]
+    if missing:
+        print("Error: Job is missing required keys: " + ', '.join(missing), file=out)
+        sys.exit(1)
+
+    if not validate_date(job['start_date']):
+        print(
+          f"Error: Invalid start date format: {job['start_date']}. Expected format: YYYY-MM-DD.",
+          file=out
+        )
+        sys.exit(1)
+
+    if not validate_date(job['end_date']):
+        print(
+          f"Error: Invalid end date format: {job['end_date']}. Expected format: YYYY-MM-DD.",
+          file=out
+        )
+        sys.exit(1)
+
+    if not validate_symbols(job['symbols']):
+        print("Error: Invalid currency symbols: " + job['symbols'], file=out)
+        print("Each symbol must be a 3-letter code separated by commas (e.g., EUR,GBP).", file=out)
+        sys.exit(1)
+
+# Function to parse and validate command-line arguments
+def parse_and_validate_args(argv=None, out=None):
+    """
+    Parses and validates the command-line arguments.
+
+    Parameters:
+    - argv (list): The arguments to parse, defaults to sys.argv[1:].
+    - out (file): Stream validation errors are printed to, defaults to sys.stdout.
+
+    Returns:
+    - argparse.Namespace: The parsed arguments, with the jobs to run in jobs.
     """
-    # Parse command-line arguments
     parser = argparse.ArgumentParser(description="Fetch historical currency exchange rates")
-    parser.add_argument('base', help="The base currency for the rates (e.g., USD)")
-    parser.add_argument('symbols', help="Comma-separated list of target currencies (e.g., EUR,GBP)")
+    parser.add_argument('base', nargs='?', help="The base currency for the rates (e.g., USD)")
+    parser.add_argument(
+      'symbols',
+      nargs='?',
+      help="Comma-separated list of target currencies (e.g., EUR,GBP)"
+    )
     parser.add_argument(
       'start_date',
+      nargs='?',
       help="Start date for the timeseries in YYYY-MM-DD format (e.g., 2023-01-01)"
     )
     parser.add_argument(
       'end_date',
+      nargs='?',
       help="End date for the timeseries in YYYY-MM-DD format (e.g., 2023-01-31)"
     )
     parser.add_argument('output_file', nargs='?', help="Output JSON file path (optional)")
+    parser.add_argument(
+      '--manifest',
+      help="JSON file listing several jobs to fetch, instead of the positional arguments"
+    )
+    parser.add_argument(
+      '--concurrency',
+      type=positive_int,
+      default=DEFAULT_JOB_CONCURRENCY,
+      help=f"Number of manifest jobs fetched in parallel (default: {DEFAULT_JOB_CONCURRENCY})"
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    positionals = (args.base, args.symbols, args.start_date, args.end_date, args.output_file)
+
+    if args.manifest:
+        if any(value is not None for value in positionals):
+            parser.error("positional arguments cannot be combined with --manifest")
+        try:
+            args.jobs = load_manifest(args.manifest)
+        except (OSError, ValueError) as e:
+            parser.error(f"invalid manifest {args.manifest}: {e}")
+    elif None in positionals[:4]:
+        parser.error("base, symbols, start_date and end_date are required without --manifest")
+    else:
+        args.jobs = [{
+            'base': args.base,
+            'symbols': args.symbols,
+            'start_date': args.start_date,
+            'end_date': args.end_date,
+            'output_file': args.output_file
+        }]
 
     # Validate arguments
-    if not validate_date(args.start_date):
-        print(f"Error: Invalid start date format: {args.start_date}. Expected format: YYYY-MM-DD.")
-        sys.exit(1)
+    for job in args.jobs:
+        validate_job(job, out)
 
-    if not validate_date(args.end_date):
-        print(f"Error: Invalid end date format: {args.end_date}. Expected format: YYYY-MM-DD.")
-        sys.exit(1)
+    return args
 
-    if not validate_symbols(args.symbols):
-        print("Error: Invalid currency symbols: " + args.symbols)
-        print("Each symbol must be a 3-letter code separated by commas (e.g., EUR,GBP).")
-        sys.exit(1)
+# Function to run a job
+def run_job(job, out=None):
+    """
+    Fetches the exchange rates of a job and saves them if it has an output file.
 
-    # Fetch data from CurrencyBeacon API
-    try:
-        symbols_list = args.symbols.split(',')
-        data = fetch_timeseries(args.base, symbols_list, args.start_date, args.end_date)
-        if args.output_file:
-            print(f"Attempting to save data to {args.output_file}")
-            save_data_to_json(data, args.output_file)
-        else:
-            print(data)
-    except ValueError as ve:
-        print("Value Error: " + str(ve))
-    except KeyError as ke:
-        print("Key Error: " + str(ke))
-    except UnauthorizedError as ue:
-        print("Unauthorized: " + str(ue))
+    Parameters:
+    - job (dict): The job with base, symbols, start_date, end_date and output_file keys.
+    - out (file): Stream for progress messages, defaults to sys.stdout.
+
+    Returns:
+    - list: The formatted exchange rates.
+    """
+    symbols_list = job['symbols'].split(',')
+    data = fetch_timeseries(job['base'], symbols_list, job['start_date'], job['end_date'])
+    if job.get('output_file'):
+        print(f"Attempting to save data to {job['output_file']}", file=out)
+        save_data_to_json(data, job['output_file'], out)
+    return data
+
+# Function to describe a job in messages
+def describe_job(job):
+    """
+    Describes a job by its currencies and date range, e.g. "USD EUR,GBP 2023-01-01 to 2023-01-31".
+
+    Parameters:
+    - job (dict): The job with base, symbols, start_date and end_date keys.
+
+    Returns:
+    - str: The description of the job.
+    """
+    return f"{job['base']} {job['symbols']} {job['start_date']} to {job['end_date']}"
+
+# Function to format the error of a failed job
+def format_error(error):
+    """
+    Formats the exception raised by a job as an error message.
+
+    Parameters:
+    - error (Exception): The exception raised by the job.
+
+    Returns:
+    - str: The error message.
+    """
+    if isinstance(error, ValueError):
+        return "Value Error: " + str(error)
+    if isinstance(error, KeyError):
+        return "Key Error: " + str(error)
+    if isinstance(error, UnauthorizedError):
+        return "Unauthorized: " + str(error)
     # Add more specific exceptions as needed
-    # pylint: disable=W0718
-    except Exception as e:  # This can still be used to catch unexpected errors
-        print("Unexpected Error: " + str(e))
+    return "Unexpected Error: " + str(error)
+
+# Main function
+def main(argv=None, out=None):
+    """
+    The main function that parses command-line arguments, validates them, and fetches
+    the currency exchange rates from the CurrencyBeacon API.
+
+    Every job runs to completion even if another one fails; failed jobs are
+    reported once all of them are done and main then exits with status 1.
+
+    Parameters:
+    - argv (list): The command-line arguments, defaults to sys.argv[1:].
+    - out (file): Stream the results and errors are printed to, defaults to sys.stdout.
+    """
+    args = parse_and_validate_args(argv, out)
+    size_connection_pool(args.concurrency)
+
+    # Fetch data from CurrencyBeacon API
+    failed = 0
+    workers = min(args.concurrency, len(args.jobs))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Submit every job up front so one failure does not cancel the queued ones
+        futures = [executor.submit(run_job, job, out) for job in args.jobs]
+        for job, future in zip(args.jobs, futures):
+            try:
+                data = future.result()
+            # Reported per job, the other jobs keep running
+            except Exception as e:  # pylint: disable=W0718
+                failed += 1
+                print(f"{format_error(e)} (job: {describe_job(job)})", file=out)
+                continue
+            if not job.get('output_file'):
+                print(data, file=out)
+
+    if failed:
+        print(f"Error: {failed} of {len(args.jobs)} jobs failed.", file=out)
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
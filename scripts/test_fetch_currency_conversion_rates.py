@@ -7,15 +7,141 @@ Usage:
     python test_fetch_currency_conversion_rates.py
 
 """
+import os
+import json
+import collections
+import tempfile
 import unittest
-from unittest.mock import patch, MagicMock
+from datetime import datetime, timedelta
+from unittest.mock import patch, mock_open
 # import sys
 from io import StringIO
 # pylint: disable=E0401
-from fetch_currency_conversion_rates import fetch_timeseries, validate_date, validate_symbols, main
+from urllib3.exceptions import MaxRetryError
+from urllib3.response import HTTPResponse
+# pylint: disable=E0401
+import fetch_currency_conversion_rates as fccr
+from fetch_currency_conversion_rates import (
+    APILimitExceededError, ensure_dir, fetch_timeseries, parse_and_validate_args, save_data_to_json,
+    split_date_range, validate_date, validate_symbols, main
+)
+
+# The tests patch the module's private session and inspect its adapter directly.
+_SESSION = fccr._SESSION  # pylint: disable=W0212
+_ADAPTER = fccr._ADAPTER  # pylint: disable=W0212
+
+# Stand-in for requests.Response exposing only what fetch_window reads;
+# much cheaper to build than a MagicMock.
+_FakeResp = collections.namedtuple(
+    '_FakeResp',
+    ['status_code', 'json', 'text', 'headers'],
+    defaults=(200, dict, '', {})
+)
+
+# Mock API responses and expected results shared by the tests; built once
+# per process instead of on every test run.
+_MOCK_SUCCESS_1 = {
+    'meta': {
+        'code': 200,
+        'disclaimer': 'Usage subject to terms: https://currencybeacon.com/terms'
+    },
+    'response': {
+        '2024-09-01': {'HTG': 131.8400},
+        '2024-09-02': {'HTG': 131.8500},
+        '2024-09-03': {'HTG': 131.8300},
+        '2024-09-04': {'HTG': 131.4700}
+    }
+}
+
+_EXPECTED_1 = [
+    {'date': '2024-09-01', 'source': 'USD', 'dest': 'HTG', 'rate': 131.8400},
+    {'date': '2024-09-02', 'source': 'USD', 'dest': 'HTG', 'rate': 131.8500},
+    {'date': '2024-09-03', 'source': 'USD', 'dest': 'HTG', 'rate': 131.8300},
+    {'date': '2024-09-04', 'source': 'USD', 'dest': 'HTG', 'rate': 131.4700}
+]
+
+_MOCK_SUCCESS_2 = {
+    'meta': {
+        'code': 200,
+        'disclaimer': 'Usage subject to terms: https://currencybeacon.com/terms'
+    },
+    'response': {
+        '2024-10-22': {'EUR': 0.92574291, 'GBP': 0.77009081},
+        '2024-10-23': {'EUR': 0.92704996, 'GBP': 0.77363489},
+        '2024-10-24': {'EUR': 0.9261928, 'GBP': 0.77054473}
+    },
+    '2024-10-22': {'EUR': 0.92574291, 'GBP': 0.77009081},
+    '2024-10-23': {'EUR': 0.92704996, 'GBP': 0.77363489},
+    '2024-10-24': {'EUR': 0.9261928, 'GBP': 0.77054473}
+}
+
+_EXPECTED_2 = [
+    {'date': '2024-10-22', 'source': 'USD', 'dest': 'EUR', 'rate': 0.9257},
+    {'date': '2024-10-22', 'source': 'USD', 'dest': 'GBP', 'rate': 0.7701},
+    {'date': '2024-10-23', 'source': 'USD', 'dest': 'EUR', 'rate': 0.927},
+    {'date': '2024-10-23', 'source': 'USD', 'dest': 'GBP', 'rate': 0.7736},
+    {'date': '2024-10-24', 'source': 'USD', 'dest': 'EUR', 'rate': 0.9262},
+    {'date': '2024-10-24', 'source': 'USD', 'dest': 'GBP', 'rate': 0.7705}
+]
+
+# fetch_timeseries cases: mock response, expected result and call arguments.
+_SUCCESS_CASES = (
+    (_MOCK_SUCCESS_1, _EXPECTED_1, 'USD', ['HTG'], '2024-09-01', '2024-09-04'),
+    (_MOCK_SUCCESS_2, _EXPECTED_2, 'USD', ['HTG', 'GBP'], '2024-09-01', '2024-09-04')
+)
+
+_MOCK_MAIN = {
+    'meta': {
+        'code': 200,
+        'disclaimer': 'Usage subject to terms: https://currencybeacon.com/terms'
+    },
+    'response': {
+        '2024-09-01': {'HTG': 131.8400}
+    }
+}
+
+# Output printed by main for _MOCK_MAIN.
+_EXPECTED_MAIN_OUT = "[{'date': '2024-09-01', 'source': 'USD', 'dest': 'HTG', 'rate': 131.84}]\n"
+
+# Data written by save_data_to_json and the file content both writers produce.
+_SAVED_DATA = [{'date': '2024-09-01', 'source': 'USD', 'dest': 'HTG', 'rate': 131.84}]
+_SAVED_JSON = """[
+  {
+    "date": "2024-09-01",
+    "source": "USD",
+    "dest": "HTG",
+    "rate": 131.84
+  }
+]"""
+
+def _as_rows(data):
+    """Converts formatted data into a tuple of (date, source, dest, rate) tuples."""
+    return tuple((row['date'], row['source'], row['dest'], row['rate']) for row in data)
+
+# validate_date inputs and expected results.
+_DATE_CASES = (
+    ('2024-09-01', True),
+    # September has 30 days
+    ('2024-09-31', False),
+    # Invalid format
+    ('09-01-2024', False),
+    # Month and day must be zero-padded
+    ('2024-9-1', False)
+)
+
+# validate_symbols inputs and expected results.
+_SYMBOL_CASES = (
+    ('HTG', True),
+    # Comma-separated symbols
+    ('HTG,USD', True),
+    # AB is not a 3-letter code
+    ('HTG,USD,AB', False),
+    # Contains numbers
+    ('HTG123', False)
+)
 
 # Test cases for code/fetch_currency_conversion_rates.py.
-class TestCurrencyConversionRates(unittest.TestCase):
+class TestCurrencyConversionRates(unittest.TestCase):  # pylint: disable=R0904
     """
     Unit tests for the currency conversion rates API.
 
@@ -26,93 +152,137 @@ class TestCurrencyConversionRates(unittest.TestCase):
     formats. Additionally, it tests the main function that 
     integrates the fetching and displaying of conversion rates.
     """
+    def setUp(self):
+        """Start each test with empty validator caches and the disk cache disabled."""
+        validate_date.cache_clear()
+        validate_symbols.cache_clear()
+
+        # Only the cache tests enable the cache, each in a temporary directory
+        env_patcher = patch.dict(os.environ)
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        os.environ.pop('CACHE_DIR', None)
+
     def test_fetch_timeseries_success(self):
-        """Test that fetch_timeseries handles a successful API response correctly."""
-        # Mock response data
-        mock_response_data = {
-					'meta': {
-						'code': 200,
-						'disclaimer': 'Usage subject to terms: https://currencybeacon.com/terms'
-					},
-					'response': {
-						'2024-09-01': {'HTG': 131.8400},
-						'2024-09-02': {'HTG': 131.8500},
-						'2024-09-03': {'HTG': 131.8300},
-						'2024-09-04': {'HTG': 131.4700}
-					}
-        }
+        """Test that fetch_timeseries handles successful API responses correctly."""
+        for mock_data, expected, base, symbols, start_date, end_date in _SUCCESS_CASES:
+            with self.subTest(symbols=symbols):
+                # Mocking the session get call to return our mock response
+                with patch.object(_SESSION, 'get') as mock_get:
+                    mock_get.return_value = _FakeResp(200, lambda data=mock_data: data)
+
+                    result = fetch_timeseries(base, symbols, start_date, end_date)
+
+                # Check if the function returns the correct formatted response
+                self.assertEqual(_as_rows(result), _as_rows(expected))
 
-        # Mocking the requests.get call to return our mock response
-        with patch('fetch_currency_conversion_rates.requests.get') as mock_get:
-            mock_get.return_value = MagicMock(
-              status_code=200,
-              json=lambda: mock_response_data
+    def test_fetch_timeseries_chunked(self):
+        """Test that fetch_timeseries splits long ranges and merges the windows in order."""
+        def mock_get(_url, params, **_kwargs):
+            day = params['start_date']
+            return _FakeResp(200, lambda: {'response': {day: {'HTG': 131.84}}})
+
+        with patch.object(_SESSION, 'get', side_effect=mock_get) as mock:
+            result = fetch_timeseries('USD', ['HTG'], '2024-09-01', '2024-09-05', chunk_days=2)
+
+            self.assertEqual(mock.call_count, 3)
+            self.assertEqual(
+              [row['date'] for row in result],
+              ['2024-09-01', '2024-09-03', '2024-09-05']
             )
 
-            # Call the fetch_timeseries function
-            base_currency = 'USD'
-            symbols = ['HTG']
-            start_date = '2024-09-01'
-            end_date = '2024-09-04'
-
-            result = fetch_timeseries(base_currency, symbols, start_date, end_date)
-
-            # Check if the function returns the correct formatted response
-            expected_result = [
-              {'date': '2024-09-01', 'source': 'USD', 'dest': 'HTG', 'rate': 131.8400},
-              {'date': '2024-09-02', 'source': 'USD', 'dest': 'HTG', 'rate': 131.8500},
-              {'date': '2024-09-03', 'source': 'USD', 'dest': 'HTG', 'rate': 131.8300},
-              {'date': '2024-09-04', 'source': 'USD', 'dest': 'HTG', 'rate': 131.4700}
-            ]
-            self.assertEqual(result, expected_result)
-
-    def test_fetch_timeseries_success2(self):
-        """Test that fetch_timeseries handles a successful API response correctly."""
-        # Mock response data
-        mock_response_data = {
-					'meta': {
-						'code': 200,
-						'disclaimer': 'Usage subject to terms: https://currencybeacon.com/terms'
-					},
-					'response': 
-					{
-						'2024-10-22': {'EUR': 0.92574291, 'GBP': 0.77009081}, 
-						'2024-10-23': {'EUR': 0.92704996, 'GBP': 0.77363489}, 
-						'2024-10-24': {'EUR': 0.9261928, 'GBP': 0.77054473}
-					},
-					'2024-10-22': {'EUR': 0.92574291, 'GBP': 0.77009081}, 
-					'2024-10-23': {'EUR': 0.92704996, 'GBP': 0.77363489}, 
-					'2024-10-24': {'EUR': 0.9261928, 'GBP': 0.77054473}
-        }
+    def test_fetch_timeseries_cached(self):
+        """Test that a past date window is served from the cache on repeat calls."""
+        mock_response_data = {'response': {'2024-09-01': {'HTG': 131.8400}}}
+
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                patch.dict(os.environ, {'CACHE_DIR': cache_dir}), \
+                patch.object(_SESSION, 'get') as mock_get:
+            mock_get.return_value = _FakeResp(200, lambda: mock_response_data)
+
+            first = fetch_timeseries('USD', ['HTG'], '2024-09-01', '2024-09-01')
+            second = fetch_timeseries('USD', ['HTG'], '2024-09-01', '2024-09-01')
+
+            self.assertEqual(mock_get.call_count, 1)
+            self.assertEqual(first, second)
+
+    def test_fetch_timeseries_cache_expiry(self):
+        """Test that a window cached before it ended is refetched once CACHE_TTL passes."""
+        end_date = (datetime.now() + timedelta(days=10)).strftime('%Y-%m-%d')
+        mock_response_data = {'response': {'2024-09-01': {'HTG': 131.8400}}}
+
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                patch.dict(os.environ, {'CACHE_DIR': cache_dir}), \
+                patch.object(_SESSION, 'get') as mock_get:
+            mock_get.return_value = _FakeResp(200, lambda: mock_response_data)
+            cache_file = fccr.get_cache_file('USD', ['HTG'], '2024-09-01', end_date)
+
+            fetch_timeseries('USD', ['HTG'], '2024-09-01', end_date, chunk_days=10000)
+            fetch_timeseries('USD', ['HTG'], '2024-09-01', end_date, chunk_days=10000)
+            self.assertEqual(mock_get.call_count, 1)
+
+            expired = datetime.now().timestamp() - fccr.CACHE_TTL - 1
+            os.utime(cache_file, (expired, expired))
+            fetch_timeseries('USD', ['HTG'], '2024-09-01', end_date, chunk_days=10000)
+            self.assertEqual(mock_get.call_count, 2)
 
-        # Mocking the requests.get call to return our mock response
-        with patch('fetch_currency_conversion_rates.requests.get') as mock_get:
-            mock_get.return_value = MagicMock(status_code=200, json=lambda: mock_response_data)
-
-            # Call the fetch_timeseries function
-            base_currency = 'USD'
-            symbols = ['HTG','GBP']
-            start_date = '2024-09-01'
-            end_date = '2024-09-04'
-
-            result = fetch_timeseries(base_currency, symbols, start_date, end_date)
-
-            # Check if the function returns the correct formatted response
-            expected_result = [
-							{'date': '2024-10-22', 'source': 'USD', 'dest': 'EUR', 'rate': 0.9257},
-							{'date': '2024-10-22', 'source': 'USD', 'dest': 'GBP', 'rate': 0.7701},
-							{'date': '2024-10-23', 'source': 'USD', 'dest': 'EUR', 'rate': 0.927},
-							{'date': '2024-10-23', 'source': 'USD', 'dest': 'GBP', 'rate': 0.7736},
-							{'date': '2024-10-24', 'source': 'USD', 'dest': 'EUR', 'rate': 0.9262},
-							{'date': '2024-10-24', 'source': 'USD', 'dest': 'GBP', 'rate': 0.7705}
-            ]
-            self.assertEqual(result, expected_result)
+    def test_fetch_timeseries_cache_aged(self):
+        """Test that a window is cached forever only if it was written after it ended."""
+        now = datetime.now()
+        end_date = (now - timedelta(days=10)).strftime('%Y-%m-%d')
+        mock_response_data = {'response': {end_date: {'HTG': 131.8400}}}
+
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                patch.dict(os.environ, {'CACHE_DIR': cache_dir}), \
+                patch.object(_SESSION, 'get') as mock_get:
+            mock_get.return_value = _FakeResp(200, lambda: mock_response_data)
+            cache_file = fccr.get_cache_file('USD', ['HTG'], end_date, end_date)
+            fetch_timeseries('USD', ['HTG'], end_date, end_date)
+
+            # Written while the window was still open: a partial snapshot
+            written_before = (now - timedelta(days=11)).timestamp()
+            os.utime(cache_file, (written_before, written_before))
+            fetch_timeseries('USD', ['HTG'], end_date, end_date)
+            self.assertEqual(mock_get.call_count, 2)
+
+            # Written after the window ended: final, whatever its age
+            written_after = (now - timedelta(days=9)).timestamp()
+            os.utime(cache_file, (written_after, written_after))
+            fetch_timeseries('USD', ['HTG'], end_date, end_date)
+            self.assertEqual(mock_get.call_count, 2)
+
+    def test_split_date_range(self):
+        """Test the split_date_range function."""
+        self.assertEqual(
+          split_date_range('2024-01-01', '2024-03-05', chunk_days=30),
+          [
+            ('2024-01-01', '2024-01-30'),
+            ('2024-01-31', '2024-02-29'),
+            ('2024-03-01', '2024-03-05')
+          ]
+        )
+        # A range shorter than a window is left untouched
+        self.assertEqual(
+          split_date_range('2024-09-01', '2024-09-04'),
+          [('2024-09-01', '2024-09-04')]
+        )
+
+    def test_fetch_timeseries_invalid_limits(self):
+        """Test that chunk_days and concurrency below 1 are rejected up front."""
+        with patch.object(_SESSION, 'get') as mock_get:
+            with self.assertRaises(ValueError):
+                split_date_range('2024-01-01', '2024-01-05', chunk_days=0)
+            with self.assertRaises(ValueError):
+                fetch_timeseries('USD', ['HTG'], '2024-01-01', '2024-01-05', chunk_days=0)
+            with self.assertRaises(ValueError):
+                fetch_timeseries('USD', ['HTG'], '2024-01-01', '2024-01-05', concurrency=0)
+            mock_get.assert_not_called()
 
     def test_fetch_timeseries_error_401(self):
         """Test that fetch_timeseries raises an exception for unauthorized request."""
-        with patch('fetch_currency_conversion_rates.requests.get') as mock_get:
-            mock_get.return_value = MagicMock(
-                status_code=401, text="Unauthorized - API key missing or incorrect."
+        with patch.object(_SESSION, 'get') as mock_get:
+            mock_get.return_value = _FakeResp(
+                401, text="Unauthorized - API key missing or incorrect."
             )
 
             with self.assertRaises(Exception) as context:
@@ -121,62 +291,225 @@ class TestCurrencyConversionRates(unittest.TestCase):
 							'Unauthorized - API key missing or incorrect.' in str(context.exception)
 						)
 
+    @unittest.skipIf(fccr.orjson is None, "orjson is not installed")
+    def test_save_data_to_json(self):
+        """Test that save_data_to_json writes the data with orjson."""
+        # Capture the writes in memory instead of round-tripping through disk
+        with patch('builtins.open', mock_open()) as mocked_open:
+            save_data_to_json(_SAVED_DATA, 'result.json', StringIO())
+
+        mocked_open.assert_called_once_with('result.json', 'wb')
+        written = [call.args[0] for call in mocked_open().write.call_args_list]
+        self.assertEqual(b''.join(written).decode('utf-8'), _SAVED_JSON)
+
+    def test_save_data_to_json_stdlib(self):
+        """Test that the stdlib fallback writes the same JSON as orjson."""
+        with patch.object(fccr, 'orjson', None), \
+                patch('builtins.open', mock_open()) as mocked_open:
+            save_data_to_json(_SAVED_DATA, 'result.json', StringIO())
+
+        mocked_open.assert_called_once_with('result.json', 'w', encoding='utf-8')
+        written = [call.args[0] for call in mocked_open().write.call_args_list]
+        self.assertEqual(''.join(written), _SAVED_JSON)
+
+    def test_ensure_dir(self):
+        """Test that ensure_dir creates missing parent directories and tolerates existing ones."""
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_file = os.path.join(output_dir, 'nested', 'deeper', 'result.json')
+            ensure_dir(output_file)
+            self.assertTrue(os.path.isdir(os.path.dirname(output_file)))
+            # A second call on the existing directory is a no-op
+            ensure_dir(output_file)
+
+    def test_fetch_timeseries_error_429(self):
+        """Test that fetch_timeseries surfaces Retry-After once the API limit is still hit."""
+        with patch.object(_SESSION, 'get') as mock_get:
+            mock_get.return_value = _FakeResp(429, headers={'Retry-After': '30'})
+
+            with self.assertRaises(APILimitExceededError) as context:
+                fetch_timeseries('USD', ['HTG'], '2024-09-01', '2024-09-04')
+            self.assertEqual(context.exception.retry_after, '30')
+            self.assertIn('Retry after: 30.', str(context.exception))
+
+    def test_session_retry_config(self):
+        """Test that the session retries transient errors and hands back the final response."""
+        retries = _ADAPTER.max_retries
+        self.assertEqual(set(retries.status_forcelist), {429, 502, 503, 504})
+        self.assertEqual(set(retries.allowed_methods), {'GET'})
+        self.assertFalse(retries.raise_on_status)
+        self.assertTrue(retries.respect_retry_after_header)
+
+    def test_session_retry_gives_up_on_long_retry_after(self):
+        """Test that a Retry-After above MAX_RETRY_AFTER is not waited for."""
+        retries = _ADAPTER.max_retries
+
+        short = HTTPResponse(status=429, headers={'Retry-After': '1'})
+        self.assertEqual(retries.increment('GET', '/timeseries', response=short).total, 4)
+
+        too_long = str(fccr.MAX_RETRY_AFTER + 1)
+        long_wait = HTTPResponse(status=429, headers={'Retry-After': too_long})
+        with self.assertRaises(MaxRetryError):
+            retries.increment('GET', '/timeseries', response=long_wait)
+
     def test_validate_date(self):
         """Test the validate_date function."""
-				# Valid date
-        self.assertTrue(validate_date('2024-09-01'))
-				# Invalid date (September has 30 days)
-        self.assertFalse(validate_date('2024-09-31'))
-				# Invalid format
-        self.assertFalse(validate_date('09-01-2024'))
+        for date_str, expected in _DATE_CASES:
+            with self.subTest(date=date_str):
+                self.assertEqual(validate_date(date_str), expected)
 
     def test_validate_symbols(self):
         """Test the validate_symbols function."""
-				# Valid symbol
-        self.assertTrue(validate_symbols('HTG'))
-				# Valid comma-separated symbols
-        self.assertTrue(validate_symbols('HTG,USD'))
-				# Invalid symbol (AB is not a 3-letter code)
-        self.assertFalse(validate_symbols('HTG,USD,AB'))
-				# Invalid format (contains numbers)
-        self.assertFalse(validate_symbols('HTG123'))
-
-    @patch('sys.stdout', new_callable=StringIO)
-    @patch('sys.argv', new=[
-			'fetch_currency_conversion_rates.py',
-			'USD', 
-			'HTG',
-			'2024-09-01',
-			'2024-09-04'
-		])
-    @patch('fetch_currency_conversion_rates.requests.get')
-    def test_main_function(self, mock_get, mock_stdout):
+        for symbols, expected in _SYMBOL_CASES:
+            with self.subTest(symbols=symbols):
+                self.assertEqual(validate_symbols(symbols), expected)
+
+    @patch.object(_SESSION, 'get')
+    def test_main_function(self, mock_get):
         """Test the main function with mocked inputs and API response."""
-        # Mock API response
-        mock_response_data = {
-            'meta': {
-							'code': 200,
-							'disclaimer': 'Usage subject to terms: https://currencybeacon.com/terms'
-            },
-            'response': {
-                '2024-09-01': {'HTG': 131.8400}
-            }
-          }
-
-        mock_get.return_value = MagicMock(status_code=200, json=lambda: mock_response_data)
+        mock_get.return_value = _FakeResp(200, lambda: _MOCK_MAIN)
 
         # Call the main function
-        main()
+        out = StringIO()
+        main(['USD', 'HTG', '2024-09-01', '2024-09-04'], out=out)
 
         # Check the printed output
-        expected_output = (
-            "[{'date': '2024-09-01', "
-            "'source': 'USD', "
-            "'dest': 'HTG', "
-            "'rate': 131.84}]"
-            "\n"
+        self.assertEqual(out.getvalue(), _EXPECTED_MAIN_OUT)
+
+    def test_main_invalid_arguments(self):
+        """Test that main prints validation errors to its output stream."""
+        out = StringIO()
+        with self.assertRaises(SystemExit) as context:
+            main(['USD', 'HTG', '2024-13-01', '2024-09-04'], out=out)
+
+        self.assertEqual(context.exception.code, 1)
+        self.assertEqual(
+          out.getvalue(),
+          "Error: Invalid start date format: 2024-13-01. Expected format: YYYY-MM-DD.\n"
+        )
+
+    @patch.object(_SESSION, 'get')
+    def test_main_output_file(self, mock_get):
+        """Test that main reports saving an output file on its output stream."""
+        mock_get.return_value = _FakeResp(200, lambda: _MOCK_MAIN)
+
+        out = StringIO()
+        with patch('builtins.open', mock_open()):
+            main(['USD', 'HTG', '2024-09-01', '2024-09-04', 'result.json'], out=out)
+
+        self.assertEqual(
+          out.getvalue(),
+          "Attempting to save data to result.json\nData saved to result.json\n"
+        )
+
+    @patch.object(_SESSION, 'get')
+    def test_main_manifest(self, mock_get):
+        """Test that main runs every job of a manifest and prints them in order."""
+        mock_response_data = {'response': {'2024-09-01': {'HTG': 131.8400}}}
+        mock_get.return_value = _FakeResp(200, lambda: mock_response_data)
+        jobs = [
+          {'base': 'USD', 'symbols': 'HTG', 'start_date': '2024-09-01', 'end_date': '2024-09-01'},
+          {'base': 'EUR', 'symbols': 'HTG', 'start_date': '2024-09-01', 'end_date': '2024-09-01'}
+        ]
+
+        with tempfile.TemporaryDirectory() as manifest_dir:
+            manifest_file = os.path.join(manifest_dir, 'jobs.json')
+            with open(manifest_file, 'w', encoding='utf-8') as f:
+                json.dump(jobs, f)
+
+            out = StringIO()
+            main(['--manifest', manifest_file], out=out)
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(
+          [line.split(', ')[1] for line in out.getvalue().splitlines()],
+          ["'source': 'USD'", "'source': 'EUR'"]
+        )
+
+    def test_main_manifest_failed_job(self):
+        """Test that a failing manifest job is reported without cancelling the other jobs."""
+        def mock_get(_url, params, **_kwargs):
+            if params['base'] == 'EUR':
+                return _FakeResp(401)
+            return _FakeResp(200, lambda: {'response': {'2024-09-01': {'HTG': 131.84}}})
+
+        # The failing job comes first and runs alone, so the others are still queued
+        jobs = [
+          {'base': base, 'symbols': 'HTG', 'start_date': '2024-09-01', 'end_date': '2024-09-01'}
+          for base in ('EUR', 'USD', 'CAD')
+        ]
+
+        with tempfile.TemporaryDirectory() as manifest_dir, \
+                patch.object(_SESSION, 'get', side_effect=mock_get) as mock:
+            manifest_file = os.path.join(manifest_dir, 'jobs.json')
+            with open(manifest_file, 'w', encoding='utf-8') as f:
+                json.dump(jobs, f)
+
+            out = StringIO()
+            with self.assertRaises(SystemExit) as context:
+                main(['--manifest', manifest_file, '--concurrency', '1'], out=out)
+
+        self.assertEqual(context.exception.code, 1)
+        self.assertEqual(mock.call_count, 3)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(
+          lines[0],
+          "Unauthorized: Unauthorized - API key missing or incorrect. "
+          "(job: EUR HTG 2024-09-01 to 2024-09-01)"
+        )
+        self.assertEqual(
+          [line.split(', ')[1] for line in lines[1:3]],
+          ["'source': 'USD'", "'source': 'CAD'"]
         )
-        self.assertEqual(mock_stdout.getvalue(), expected_output)
+        self.assertEqual(lines[3], "Error: 1 of 3 jobs failed.")
+
+    def test_size_connection_pool(self):
+        """Test that any --concurrency is accepted and sizes the connection pool."""
+        args = parse_and_validate_args(
+          ['USD', 'HTG', '2024-09-01', '2024-09-01', '--concurrency', '16']
+        )
+        self.assertEqual(args.concurrency, 16)
+
+        self.addCleanup(fccr.size_connection_pool, fccr.DEFAULT_JOB_CONCURRENCY)
+        fccr.size_connection_pool(args.concurrency)
+        self.assertEqual(
+          _ADAPTER.poolmanager.connection_pool_kw['maxsize'],
+          16 * fccr.DEFAULT_CONCURRENCY
+        )
+
+    @patch('sys.stderr', new_callable=StringIO)
+    def test_parse_and_validate_args_invalid_manifest(self, _mock_stderr):
+        """Test that unreadable or malformed manifests are reported as usage errors."""
+        job = {
+          'base': 'USD', 'symbols': 'HTG', 'start_date': '2024-09-01', 'end_date': '2024-09-01'
+        }
+        contents = (
+          'not json',
+          '[]',
+          json.dumps(job),
+          json.dumps([1]),
+          json.dumps([dict(job, symbols=['HTG'])])
+        )
+
+        with tempfile.TemporaryDirectory() as manifest_dir:
+            manifest_file = os.path.join(manifest_dir, 'jobs.json')
+            for content in contents:
+                with self.subTest(content=content):
+                    with open(manifest_file, 'w', encoding='utf-8') as f:
+                        f.write(content)
+                    with self.assertRaises(SystemExit) as context:
+                        parse_and_validate_args(['--manifest', manifest_file])
+                    self.assertEqual(context.exception.code, 2)
+
+            for argv in (
+              ['--manifest', os.path.join(manifest_dir, 'missing.json')],
+              ['USD', 'HTG', '2024-09-01', '2024-09-01', '--manifest', manifest_file],
+              ['USD', 'HTG', '2024-09-01', '2024-09-01', '--concurrency', '0'],
+              ['USD', 'HTG', '2024-09-01', '2024-09-01', '--concurrency', 'four']
+            ):
+                with self.subTest(argv=argv):
+                    with self.assertRaises(SystemExit) as context:
+                        parse_and_validate_args(argv)
+                    self.assertEqual(context.exception.code, 2)
 
 if __name__ == '__main__':
     unittest.main()